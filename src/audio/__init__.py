@@ -1 +1,24 @@
-from .transcription import AudioStreamer
\ No newline at end of file
+import importlib
+
+# Exports are loaded on first access so importing src.audio (e.g. for the model list)
+# does not pull in NumPy, SoundCard and Faster Whisper at startup.
+_EXPORTS = {
+    "AudioStreamer": ".transcription",
+    "ReplayStreamer": ".transcription",
+    "SessionRecorder": ".recorder",
+    "load_session": ".recorder",
+    "replay_session": ".replay",
+    "PreprocessingChain": ".preprocessing",
+    "Segment": ".segments",
+    "Word": ".segments",
+    "ModelStore": ".model_store",
+    "WHISPER_MODELS": ".model_store",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,251 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+# Whisper Models
+WHISPER_MODELS = [
+    "tiny", "tiny.en", "base", "base.en", "small", "small.en",
+    "medium", "medium.en", "large-v1", "large-v2", "large-v3",
+    "distil-small.en", "distil-medium.en", "distil-large-v2", "distil-large-v3"
+]
+
+BASE_VARIANT = "float16"  # Quantization of the CTranslate2 models published on the hub
+QUANTIZED_VARIANTS = ["int8", "int8_float32"]  # Variants worth keeping pre-converted on disk
+MODEL_STORE_DIR = os.environ.get("LIVE_SUBTITLES_MODEL_STORE", "models")
+INDEX_FILE = "index.json"
+
+
+def transformers_model_id(model_name: str) -> str:
+    """Return the original Transformers checkpoint a Whisper model is converted from."""
+    if model_name.startswith("distil-"):
+        return f"distil-whisper/{model_name}"
+    if model_name == "large-v1":
+        return "openai/whisper-large"
+    return f"openai/whisper-{model_name}"
+
+
+def file_checksum(path: str) -> str:
+    """Return the SHA-256 of a file, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ModelStore:
+    """Local store of Whisper models with pre-quantized variants and an integrity index."""
+
+    def __init__(self, root: str = MODEL_STORE_DIR):
+        self.root = root
+        self.index_path = os.path.join(root, INDEX_FILE)
+        self.index = self.load_index()
+
+    def load_index(self) -> dict:
+        """Read the integrity index, or start an empty one."""
+        if not os.path.exists(self.index_path):
+            return {}
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save_index(self):
+        """Write the integrity index atomically."""
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def model_path(self, model_name: str, variant: str = BASE_VARIANT) -> str:
+        """Directory holding a model variant."""
+        return os.path.join(self.root, model_name, variant)
+
+    def entries(self):
+        """Return the stored (model_name, variant) pairs."""
+        return [tuple(key.split("/", 1)) for key in sorted(self.index)]
+
+    # --- Integrity ---
+    def add_to_index(self, model_name: str, variant: str):
+        """Record the size and checksum of every file in a model variant."""
+        path = self.model_path(model_name, variant)
+        files = {}
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]  # Skip hub download metadata
+            for filename in filenames:
+                file_path = os.path.join(dirpath, filename)
+                rel_path = os.path.relpath(file_path, path).replace(os.sep, "/")
+                files[rel_path] = {"size": os.path.getsize(file_path), "sha256": file_checksum(file_path)}
+
+        if "model.bin" not in files:
+            raise ValueError(f"{path} is not a CTranslate2 Whisper model (missing model.bin)")
+
+        self.index[f"{model_name}/{variant}"] = {"files": files}
+        self.save_index()
+
+    def verify(self, model_name: str, variant: str = BASE_VARIANT, full: bool = False) -> bool:
+        """Check a model variant against the index; sizes only unless full is set."""
+        entry = self.index.get(f"{model_name}/{variant}")
+        if entry is None:
+            return False
+
+        path = self.model_path(model_name, variant)
+        for rel_path, info in entry["files"].items():
+            file_path = os.path.join(path, rel_path)
+            if not os.path.isfile(file_path) or os.path.getsize(file_path) != info["size"]:
+                return False
+            if full and file_checksum(file_path) != info["sha256"]:
+                return False
+        return True
+
+    def resolve(self, model_name: str, compute_type: str = BASE_VARIANT):
+        """Return the local path to load for a model, preferring a pre-quantized variant.
+
+        Falls back to the base variant, then to any other stored variant: CTranslate2 converts
+        weights to the requested compute type at load time, which still beats going to the hub.
+        Only the index and file sizes are checked, so this never touches the network.
+        Returns None if the model has no stored variant at all.
+        """
+        stored = [variant for name, variant in self.entries() if name == model_name]
+        for variant in [compute_type, BASE_VARIANT] + stored:
+            if self.verify(model_name, variant):
+                return self.model_path(model_name, variant)
+        return None
+
+    # --- Populating the store ---
+    def prefetch(self, model_name: str):
+        """Download a model from the hub into the store."""
+        from faster_whisper.utils import download_model
+
+        path = self.model_path(model_name)
+        download_model(model_name, output_dir=path)
+        self.add_to_index(model_name, BASE_VARIANT)
+        return path
+
+    def import_model(self, model_name: str, source: str, variant: str = BASE_VARIANT):
+        """Import a model from a directory or an archive (zip, tar, tar.gz, ...)."""
+        path = self.model_path(model_name, variant)
+
+        with tempfile.TemporaryDirectory(dir=self.ensure_root()) as tmp_dir:
+            if os.path.isdir(source):
+                shutil.copytree(source, os.path.join(tmp_dir, "model"))
+            else:
+                shutil.unpack_archive(source, os.path.join(tmp_dir, "model"))
+
+            # Validate before touching the existing copy, so a bad import never wipes a working model
+            staged = self.find_model_dir(os.path.join(tmp_dir, "model"))
+
+            backup = os.path.join(tmp_dir, "previous")
+            if os.path.exists(path):
+                shutil.move(path, backup)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            try:
+                shutil.move(staged, path)
+                self.add_to_index(model_name, variant)
+            except Exception:
+                shutil.rmtree(path, ignore_errors=True)
+                if os.path.exists(backup):
+                    shutil.move(backup, path)
+                raise
+
+        return path
+
+    def convert(self, model_name: str, quantization: str):
+        """Convert a model to a quantized variant so it is not requantized at load time.
+
+        CTranslate2 cannot requantize an already converted model, so this converts the
+        original Transformers checkpoint and needs the optional 'transformers' and 'torch' packages.
+        """
+        try:
+            from ctranslate2.converters import TransformersConverter
+        except ImportError as e:
+            raise RuntimeError("Converting models requires 'transformers' and 'torch' to be installed") from e
+
+        path = self.model_path(model_name, quantization)
+        converter = TransformersConverter(
+            transformers_model_id(model_name),
+            copy_files=["tokenizer.json", "preprocessor_config.json"],
+        )
+        converter.convert(path, quantization=quantization, force=True)
+        self.add_to_index(model_name, quantization)
+        return path
+
+    def remove(self, model_name: str, variant: str = BASE_VARIANT):
+        """Delete a model variant and its index entry."""
+        shutil.rmtree(self.model_path(model_name, variant), ignore_errors=True)
+        self.index.pop(f"{model_name}/{variant}", None)
+        self.save_index()
+
+    def ensure_root(self) -> str:
+        """Create the store directory if needed and return it."""
+        os.makedirs(self.root, exist_ok=True)
+        return self.root
+
+    @staticmethod
+    def find_model_dir(path: str) -> str:
+        """Find the directory containing model.bin inside an imported directory or archive."""
+        for dirpath, _, filenames in os.walk(path):
+            if "model.bin" in filenames:
+                return dirpath
+        raise ValueError("Source is not a CTranslate2 Whisper model (missing model.bin)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the local Whisper model store.")
+    parser.add_argument("--store", default=MODEL_STORE_DIR, help="Model store directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    prefetch = commands.add_parser("prefetch", help="Download models and their quantized variants")
+    prefetch.add_argument("models", nargs="+", choices=WHISPER_MODELS)
+    prefetch.add_argument("--quantize", nargs="+", default=[], choices=QUANTIZED_VARIANTS,
+                          help="Also convert these quantized variants")
+
+    import_parser = commands.add_parser("import", help="Import a model from a directory or archive")
+    import_parser.add_argument("model", choices=WHISPER_MODELS)
+    import_parser.add_argument("source")
+    import_parser.add_argument("--variant", default=BASE_VARIANT)
+
+    verify = commands.add_parser("verify", help="Verify stored models against their checksums")
+    verify.add_argument("models", nargs="*", metavar="model", help="Models to verify (default: all)")
+
+    commands.add_parser("list", help="List stored models")
+
+    args = parser.parse_args(argv)
+    store = ModelStore(args.store)
+
+    try:
+        if args.command == "prefetch":
+            for model_name in args.models:
+                print(f"Fetching {model_name}...")
+                store.prefetch(model_name)
+                for quantization in args.quantize:
+                    print(f"Converting {model_name} to {quantization}...")
+                    store.convert(model_name, quantization)
+
+        elif args.command == "import":
+            print(f"Imported {args.model} to {store.import_model(args.model, args.source, args.variant)}")
+
+        elif args.command == "verify":
+            failed = False
+            for model_name, variant in store.entries():
+                if args.models and model_name not in args.models:
+                    continue
+                ok = store.verify(model_name, variant, full=True)
+                failed = failed or not ok
+                print(f"{model_name}/{variant}: {'ok' if ok else 'CORRUPT'}")
+            return 1 if failed else 0
+
+        elif args.command == "list":
+            for model_name, variant in store.entries():
+                print(f"{model_name}/{variant}")
+
+    except Exception as e:
+        print(f"Error in model store: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,234 @@
+import argparse
+import time
+
+import numpy as np
+from scipy.signal import butter, lfilter, sosfilt
+
+SILENCE_DBFS = -60.0  # Below this a frame is treated as silence
+
+
+def db_to_gain(db: float) -> float:
+    return 10.0 ** (db / 20.0)
+
+
+def frame_power(block: np.ndarray, frame: int) -> np.ndarray:
+    """Mean power of each frame in a block; a trailing partial frame is zero padded."""
+    if len(block) == 0:
+        return np.zeros(0, dtype=block.dtype)
+
+    frames = -(-len(block) // frame)
+    padded = np.zeros(frames * frame, dtype=block.dtype)
+    padded[:len(block)] = block
+    return np.mean(np.square(padded.reshape(frames, frame)), axis=1)
+
+
+class Stage:
+    """A streaming preprocessing stage that keeps its state across blocks."""
+    name = "stage"
+
+    def __init__(self):
+        self.counters = {"blocks": 0, "samples": 0, "time_sec": 0.0}
+
+    def __call__(self, block: np.ndarray) -> np.ndarray:
+        if len(block) == 0:  # Nothing to do, and frame-based stages cannot reshape an empty block
+            return block
+
+        start = time.perf_counter()
+        out = self.process(block)
+        self.counters["blocks"] += 1
+        self.counters["samples"] += len(block)
+        self.counters["time_sec"] += time.perf_counter() - start
+        return out
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+
+class DCBlocker(Stage):
+    """One-pole DC blocking filter: y[n] = x[n] - x[n-1] + r * y[n-1]."""
+    name = "dc_removal"
+
+    def __init__(self, sample_rate: int, cutoff_hz: float = 5.0):
+        super().__init__()
+        r = np.exp(-2.0 * np.pi * cutoff_hz / sample_rate)
+        self.b = np.array([1.0, -1.0])
+        self.a = np.array([1.0, -r])
+        self.zi = np.zeros(1)  # Filter state carried between blocks
+
+    def process(self, block):
+        out, self.zi = lfilter(self.b, self.a, block, zi=self.zi)
+        return out
+
+
+class HighPass(Stage):
+    """Butterworth high-pass filter to remove low-frequency rumble."""
+    name = "highpass"
+
+    def __init__(self, sample_rate: int, cutoff_hz: float = 80.0, order: int = 2):
+        super().__init__()
+        self.sos = butter(order, cutoff_hz, btype="highpass", fs=sample_rate, output="sos")
+        self.zi = np.zeros((self.sos.shape[0], 2))  # Filter state carried between blocks
+
+    def process(self, block):
+        out, self.zi = sosfilt(self.sos, block, zi=self.zi)
+        return out
+
+
+class NoiseGate(Stage):
+    """Attenuates frames below a threshold, holding the gate open briefly after speech."""
+    name = "noise_gate"
+
+    def __init__(self, sample_rate: int, threshold_dbfs: float = SILENCE_DBFS, frame_ms: int = 10,
+                 hold_ms: int = 200, floor_db: float = -40.0):
+        super().__init__()
+        self.frame = int(sample_rate * frame_ms / 1000)
+        self.threshold_power = db_to_gain(threshold_dbfs) ** 2
+        self.hold_frames = hold_ms // frame_ms
+        self.floor = db_to_gain(floor_db)
+        self.last_open = -(self.hold_frames + 1)  # Last open frame, relative to the next block; starts closed
+        self.last_gain = self.floor
+        self.counters.update(frames=0, frames_gated=0)
+
+    def process(self, block):
+        if len(block) == 0:
+            return block
+
+        power = frame_power(block, self.frame)
+        frames = len(power)
+        index = np.arange(frames)
+
+        # Index of the most recent open frame at each frame, carried over from the previous block
+        last_open = np.maximum.accumulate(np.where(power >= self.threshold_power, index, self.last_open))
+        held_open = index - last_open <= self.hold_frames
+        self.last_open = max(last_open[-1] - frames, -(self.hold_frames + 1))
+
+        # Interpolate frame gains across samples so the gate does not click
+        gains = np.where(held_open, 1.0, self.floor)
+        centers = np.concatenate(([-self.frame / 2], index * self.frame + self.frame / 2))
+        sample_gains = np.interp(np.arange(len(block)), centers, np.concatenate(([self.last_gain], gains)))
+        self.last_gain = gains[-1]
+
+        self.counters["frames"] += frames
+        self.counters["frames_gated"] += int(frames - np.count_nonzero(held_open))
+        return block * sample_gains
+
+
+class LoudnessNormalizer(Stage):
+    """Slow automatic gain control towards a target RMS level, followed by a peak limiter."""
+    name = "loudness"
+
+    def __init__(self, sample_rate: int, target_dbfs: float = -20.0, max_gain_db: float = 30.0,
+                 min_gain_db: float = -20.0, time_constant_sec: float = 3.0, frame_ms: int = 10,
+                 limit: float = 0.99):
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.frame = int(sample_rate * frame_ms / 1000)
+        self.target_dbfs = target_dbfs
+        self.max_gain_db = max_gain_db
+        self.min_gain_db = min_gain_db
+        self.time_constant_sec = time_constant_sec
+        self.limit = limit
+        self.silence_power = db_to_gain(SILENCE_DBFS) ** 2
+        self.loudness_db = None  # Smoothed loudness of non-silent audio
+        self.gain = 1.0
+        self.counters.update(gain_db=0.0, clipped_samples=0)
+
+    def process(self, block):
+        # Measure loudness over non-silent frames only, so pauses do not pump the gain up
+        power = frame_power(block, self.frame)
+        active = power[power > self.silence_power]
+        if len(active):
+            level_db = 10.0 * np.log10(np.mean(active))
+            if self.loudness_db is None:
+                self.loudness_db = level_db
+            else:
+                alpha = 1.0 - np.exp(-len(block) / self.sample_rate / self.time_constant_sec)
+                self.loudness_db += alpha * (level_db - self.loudness_db)
+
+        new_gain = self.gain
+        if self.loudness_db is not None:
+            gain_db = np.clip(self.target_dbfs - self.loudness_db, self.min_gain_db, self.max_gain_db)
+            new_gain = db_to_gain(gain_db)
+
+        # Ramp from the previous gain to avoid steps at block boundaries
+        out = block * np.linspace(self.gain, new_gain, len(block))
+        self.gain = new_gain
+
+        clipped = np.count_nonzero(np.abs(out) > self.limit)
+        if clipped:
+            np.clip(out, -self.limit, self.limit, out=out)
+
+        self.counters["gain_db"] = float(20.0 * np.log10(self.gain))
+        self.counters["clipped_samples"] += int(clipped)
+        return out
+
+
+class PreprocessingChain:
+    """Streaming audio preprocessing applied to each mono chunk before transcription.
+
+    Pass None for an option to disable its stage.
+    """
+
+    def __init__(self, sample_rate: int = 16000, dc_cutoff_hz=5.0, highpass_hz=80.0,
+                 gate_threshold_dbfs=SILENCE_DBFS, target_dbfs=-20.0):
+        self.sample_rate = sample_rate
+        self.stages = []
+        if dc_cutoff_hz is not None:
+            self.stages.append(DCBlocker(sample_rate, dc_cutoff_hz))
+        if highpass_hz is not None:
+            self.stages.append(HighPass(sample_rate, highpass_hz))
+        if gate_threshold_dbfs is not None:
+            self.stages.append(NoiseGate(sample_rate, gate_threshold_dbfs))
+        if target_dbfs is not None:
+            self.stages.append(LoudnessNormalizer(sample_rate, target_dbfs))
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """Return a processed float32 copy of the chunk; the input is never modified."""
+        data = np.asarray(chunk, dtype=np.float64)
+        for stage in self.stages:
+            data = stage(data)
+        return data.astype(np.float32)
+
+    def stats(self) -> dict:
+        """Per-stage counters."""
+        return {stage.name: dict(stage.counters) for stage in self.stages}
+
+    def format_stats(self) -> str:
+        """Per-stage counters as readable text, including CPU cost per second of audio."""
+        lines = ["Preprocessing stats:"]
+        for name, counters in self.stats().items():
+            audio_sec = counters["samples"] / self.sample_rate
+            cost_ms = counters["time_sec"] * 1000 / audio_sec if audio_sec else 0.0
+            extra = ", ".join(
+                f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in counters.items() if key not in ("blocks", "samples", "time_sec")
+            )
+            lines.append(f"  {name:<12}{cost_ms:7.3f} ms per second of audio" + (f"  ({extra})" if extra else ""))
+        return "\n".join(lines)
+
+
+def benchmark(seconds: float = 60.0, chunk_sec: float = 2.0, sample_rate: int = 16000):
+    """Run the chain over synthetic noisy speech-like audio and print its cost."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    envelope = (np.sin(2 * np.pi * 0.5 * t) > 0).astype(np.float32)  # Alternate speech and pauses
+    audio = (envelope * (0.01 * rng.standard_normal(len(t))  # Quiet "speech", about -40 dBFS
+                         + 0.05 * np.sin(2 * np.pi * 30 * t))  # Rumble while the source is playing
+             + 0.0001 * rng.standard_normal(len(t))  # Pauses are near-silent (about -80 dBFS), so the gate closes
+             + 0.02).astype(np.float32)  # DC offset
+
+    chain = PreprocessingChain(sample_rate)
+    chunk = int(chunk_sec * sample_rate)
+    start = time.perf_counter()
+    for offset in range(0, len(audio), chunk):
+        chain.process(audio[offset:offset + chunk])
+    total = time.perf_counter() - start
+
+    print(chain.format_stats())
+    print(f"Total: {total * 1000 / seconds:.3f} ms per second of audio (real-time factor {total / seconds:.5f})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the audio preprocessing chain.")
+    parser.add_argument("--seconds", type=float, default=60.0, help="Seconds of synthetic audio")
+    benchmark(parser.parse_args().seconds)
@@ -0,0 +1,114 @@
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+SESSIONS_DIR = "sessions"  # Where recorded sessions are stored by default
+MAX_SESSION_SEC = 60 * 60  # Preallocate room for one hour of audio
+INDEX_EVERY_CHUNKS = 5  # Rewrite the index this often, so a crash or hard exit keeps a usable session
+
+
+def session_paths(path: str):
+    """Return the (audio, index) file paths for a session base path."""
+    base, ext = os.path.splitext(path)
+    if ext in (".f32", ".json"):
+        path = base
+    return path + ".f32", path + ".json"
+
+
+def load_session(path: str):
+    """Open a recorded session, returning the audio memmap and its index."""
+    audio_path, index_path = session_paths(path)
+    with open(index_path, "r", encoding="utf-8") as f:
+        index = json.load(f)
+
+    if index["frames"] == 0:
+        return np.zeros(0, dtype=np.float32), index
+
+    # Copy-on-write so the engine can never modify the recording in place
+    audio = np.memmap(audio_path, dtype=np.float32, mode="c", shape=(index["frames"],))
+    return audio, index
+
+
+class SessionRecorder:
+    """Writes the captured mono 16 kHz stream to a preallocated memory-mapped file."""
+
+    def __init__(self, path: str = None, sample_rate: int = 16000, max_seconds: int = MAX_SESSION_SEC,
+                 metadata: dict = None):
+        if path is None:
+            os.makedirs(SESSIONS_DIR, exist_ok=True)
+            path = os.path.join(SESSIONS_DIR, time.strftime("session-%Y%m%d-%H%M%S"))
+
+        self.audio_path, self.index_path = session_paths(path)
+        self.sample_rate = sample_rate
+        self.capacity = int(sample_rate * max_seconds)
+        self.audio = np.memmap(self.audio_path, dtype=np.float32, mode="w+", shape=(self.capacity,))
+        self.frames = 0  # Frames written so far
+        self.chunks = []  # Chunk boundaries and the text emitted for each
+        self.metadata = metadata or {}  # Model and decode settings, so replays can reuse them
+        self.full = False
+        self.lock = threading.Lock()  # Transcription tasks annotate from the thread pool
+        self.write_index()
+
+    def reserve(self, numframes: int):
+        """Return (chunk_index, view) for the next chunk, or (None, None) once the file is full.
+
+        The capture thread writes straight into the returned view, so no extra copy is made.
+        """
+        with self.lock:
+            if self.audio is None or self.frames + numframes > self.capacity:
+                if not self.full:
+                    self.full = True
+                    print(f"Session file is full ({self.capacity / self.sample_rate:.0f} s), recording stopped")
+                return None, None
+
+            view = self.audio[self.frames:self.frames + numframes]
+            # text stays None until the chunk's transcription finishes, so dropped chunks are recognizable
+            self.chunks.append({"offset": self.frames, "frames": numframes, "text": None, "sampled": False})
+            self.frames += numframes
+            chunk_index = len(self.chunks) - 1
+
+        # Written before this chunk's audio, so the index only ever covers chunks already on disk
+        if chunk_index % INDEX_EVERY_CHUNKS == 0:
+            self.write_index(chunk_index)
+        return chunk_index, view
+
+    def annotate(self, chunk_index: int, text: list, sampled: bool = False):
+        """Record the text emitted for a chunk once its transcription has finished.
+
+        sampled marks chunks where Whisper fell back to temperature sampling.
+        """
+        with self.lock:
+            self.chunks[chunk_index]["text"] = list(text)
+            self.chunks[chunk_index]["sampled"] = sampled
+
+    def write_index(self, chunks: int = None):
+        """Atomically write the index of the first `chunks` chunks (default: all) next to the audio file."""
+        with self.lock:
+            written = self.chunks[:chunks]
+            index = {
+                "sample_rate": self.sample_rate,
+                "frames": sum(chunk["frames"] for chunk in written),
+                "metadata": self.metadata,
+                "chunks": [dict(chunk) for chunk in written],  # annotate() replaces text lists, never mutates them
+            }
+
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def close(self):
+        """Flush the audio to disk, write the index and shrink the file to what was recorded."""
+        if self.audio is not None:
+            self.audio.flush()
+            self.audio = None  # Outstanding chunk views keep the mapping alive
+        self.write_index()
+
+        try:
+            os.truncate(self.audio_path, self.frames * np.dtype(np.float32).itemsize)
+        except OSError as e:  # Windows refuses while a chunk view is still mapped
+            print(f"Error shrinking session file: {e}")
+        print(f"Session recorded to {self.audio_path}")
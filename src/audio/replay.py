@@ -0,0 +1,128 @@
+import argparse
+import difflib
+import time
+
+import ctranslate2
+
+from .model_store import BASE_VARIANT
+from .preprocessing import PreprocessingChain
+from .recorder import load_session
+from .transcription import SAMPLE_RATE, TranscriptionTask, get_whisper_model
+
+REPLAY_SEED = 0  # Seeds temperature-fallback sampling, so replays of a session agree with each other
+
+
+def chunk_status(chunk: dict) -> str:
+    """Classify a replayed chunk against the recording.
+
+    "untranscribed": the recording never finished this chunk (dropped on stop), so there is nothing to compare.
+    "sampled": the texts differ, but Whisper fell back to sampling on either side, so a difference is expected.
+    """
+    if chunk["expected"] is None:
+        return "untranscribed"
+    if chunk["expected"] == chunk["replayed"]:
+        return "match"
+    if chunk["sampled"]:
+        return "sampled"
+    return "differs"
+
+
+def replay_session(session_path: str, model_name: str = None, **overrides) -> dict:
+    """Transcribe a recorded session headlessly, chunk by chunk in order.
+
+    Decode settings default to the ones stored with the recording; overrides replace them.
+    Returns the per-chunk expected and replayed text, plus audio and decode time.
+    """
+    audio, index = load_session(session_path)
+    sample_rate = index.get("sample_rate", SAMPLE_RATE)
+    settings = dict(index.get("metadata", {}))
+    settings.update({key: value for key, value in overrides.items() if value is not None})
+    model_name = model_name or settings.pop("model_name", None) or "medium"
+    settings.pop("model_name", None)
+
+    model = get_whisper_model(model_name, settings.get("device") or "cpu", settings.get("compute_type") or BASE_VARIANT)
+    preprocessor = PreprocessingChain(sample_rate) if settings.get("preprocessing") else None
+
+    chunks = []
+    decode_sec = 0.0
+    for chunk_info in index["chunks"]:
+        offset, frames = chunk_info["offset"], chunk_info["frames"]
+        chunk = audio[offset:offset + frames]
+        if preprocessor is not None:
+            chunk = preprocessor.process(chunk)
+
+        # Untranscribed chunks are still decoded, for timing and to keep the preprocessing state in step
+        ctranslate2.set_random_seed(REPLAY_SEED)
+        started = time.perf_counter()
+        task = TranscriptionTask(model, chunk, None, chunk_start=offset / sample_rate, **settings)
+        segments = list(task.transcribe())
+        decode_sec += time.perf_counter() - started
+
+        chunks.append({
+            "offset": offset,
+            "expected": chunk_info["text"],
+            "replayed": [segment.text for segment in segments],
+            "sampled": chunk_info.get("sampled", False) or any(segment.temperature > 0 for segment in segments),
+        })
+
+    return {
+        "model_name": model_name,
+        "sample_rate": sample_rate,
+        "audio_sec": index["frames"] / sample_rate,
+        "decode_sec": decode_sec,
+        "chunks": chunks,
+    }
+
+
+def format_report(result: dict) -> str:
+    """Describe text differences against the recording and the real-time factor."""
+    lines = []
+    counts = {"match": 0, "differs": 0, "sampled": 0, "untranscribed": 0}
+    for i, chunk in enumerate(result["chunks"]):
+        status = chunk_status(chunk)
+        counts[status] += 1
+        if status not in ("differs", "sampled"):
+            continue
+
+        note = " (sampled fallback, may legitimately differ)" if status == "sampled" else ""
+        lines.append(f"Chunk {i} at {chunk['offset'] / result['sample_rate']:.1f} s{note}:")
+        lines += [f"  {line}" for line in difflib.ndiff(chunk["expected"], chunk["replayed"]) if line[0] in "-+"]
+
+    audio_sec = result["audio_sec"]
+    rtf = result["decode_sec"] / audio_sec if audio_sec else 0.0
+    compared = len(result["chunks"]) - counts["untranscribed"]
+    lines.append(f"{counts['match']}/{compared} transcribed chunks match the recording "
+                 f"({counts['differs']} differ, {counts['sampled']} sampled, "
+                 f"{counts['untranscribed']} never transcribed while recording)")
+    lines.append(f"Decoded {audio_sec:.1f} s of audio in {result['decode_sec']:.2f} s "
+                 f"with {result['model_name']} (real-time factor {rtf:.3f})")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded session and compare it with the recording.")
+    parser.add_argument("session", help="Session path (with or without .f32/.json)")
+    parser.add_argument("--model", help="Model to use (default: the one recorded)")
+    parser.add_argument("--device", help="Device to use (default: the one recorded)")
+    parser.add_argument("--compute-type", help="Compute type to use (default: the one recorded)")
+    parser.add_argument("--preprocessing", dest="preprocessing", action="store_const", const=True,
+                        help="Apply audio preprocessing (default: as recorded)")
+    parser.add_argument("--no-preprocessing", dest="preprocessing", action="store_const", const=False,
+                        help="Skip audio preprocessing (default: as recorded)")
+    args = parser.parse_args(argv)
+
+    try:
+        result = replay_session(
+            args.session, args.model,
+            device=args.device, compute_type=args.compute_type, preprocessing=args.preprocessing
+        )
+    except Exception as e:
+        print(f"Error in session replay: {e}")
+        return 1
+
+    print(format_report(result))
+    return 1 if any(chunk_status(chunk) == "differs" for chunk in result["chunks"]) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,44 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class Word:
+    """A single word with its timing in seconds since the stream started."""
+    word: str
+    start: float
+    end: float
+    probability: float
+
+
+@dataclass
+class Segment:
+    """A transcribed segment with timing in seconds since the stream started.
+
+    avg_logprob and no_speech_prob are kept so the UI can filter segments without re-decoding.
+    temperature is above 0 when Whisper fell back to sampling, so the text is not deterministic.
+    """
+    text: str
+    start: float
+    end: float
+    avg_logprob: float
+    no_speech_prob: float
+    temperature: float = 0.0
+    words: List[Word] = field(default_factory=list)
+
+    @classmethod
+    def from_whisper(cls, segment, offset: float = 0.0) -> "Segment":
+        """Build from a Faster Whisper segment, shifting its times by the chunk offset."""
+        words = [
+            Word(word.word, offset + word.start, offset + word.end, word.probability)
+            for word in (segment.words or [])
+        ]
+        return cls(
+            text=segment.text.strip(),
+            start=offset + segment.start,
+            end=offset + segment.end,
+            avg_logprob=segment.avg_logprob,
+            no_speech_prob=segment.no_speech_prob,
+            temperature=segment.temperature,
+            words=words,
+        )
@@ -1,25 +1,46 @@
+import time
+
 import numpy as np
 import soundcard as sc
 from faster_whisper import WhisperModel
 from PyQt6.QtCore import QThread, pyqtSignal, QThreadPool, QRunnable
 
+from .model_store import ModelStore, BASE_VARIANT
+from .preprocessing import PreprocessingChain
+from .recorder import SessionRecorder, load_session
+from .segments import Segment
+
 SAMPLE_RATE = 16000  # Faster Whisper expects 16 kHz
 CHUNK_SEC = 2  # Reduce latency (1-second chunks)
 MODEL_CACHE = {}  # Cache for loaded models
 
-def get_whisper_model(model_name: str = "medium", device: str = "cpu"):
-    """Load the Faster Whisper model and cache it to avoid reloading."""
-    if model_name not in MODEL_CACHE:
-        MODEL_CACHE[model_name] = WhisperModel(model_name, device, compute_type="float16")
-    return MODEL_CACHE[model_name]
+def get_whisper_model(model_name: str = "medium", device: str = "cpu", compute_type: str = BASE_VARIANT):
+    """Load the Faster Whisper model and cache it to avoid reloading.
+
+    Models in the local store are loaded from disk, preferring a variant already
+    quantized to compute_type; only models with no stored variant are downloaded from the hub.
+    """
+    key = (model_name, device, compute_type)
+    if key not in MODEL_CACHE:
+        local_path = ModelStore().resolve(model_name, compute_type)
+        MODEL_CACHE[key] = WhisperModel(
+            local_path or model_name,
+            device,
+            compute_type=compute_type,
+            local_files_only=local_path is not None
+        )
+    return MODEL_CACHE[key]
 
 class TranscriptionTask(QRunnable):
     """Runs Faster Whisper transcription in a separate thread."""
-    def __init__(self, model, chunk, signal, **settings):
+    def __init__(self, model, chunk, signal, session=None, chunk_index=None, chunk_start=0.0, **settings):
         super().__init__()
         self.model = model
         self.chunk = chunk  # Process a single chunk at a time
         self.signal = signal
+        self.chunk_start = chunk_start  # Seconds since the stream started, so segment times are absolute
+        self.session = session  # Optional SessionRecorder to annotate with emitted text once finished
+        self.chunk_index = chunk_index
 
         self.language = settings.get("language", None)
         self.task = settings.get("task", "transcribe")
@@ -31,36 +52,61 @@ class TranscriptionTask(QRunnable):
             self.temperature = [float(value.strip()) for value in self.temperature.split(",")]
 
         self.supress_blank = settings.get("supress_blank", True)
+        self.word_timestamps = settings.get("word_timestamps", False)
+
+    def transcribe(self):
+        """Yield the chunk's non-empty segments as soon as each is decoded."""
+        segments, _ = self.model.transcribe(
+            self.chunk,
+            language=self.language,
+            task=self.task,
+            beam_size=self.beam_size,
+            temperature=self.temperature,
+            suppress_blank=self.supress_blank,
+            word_timestamps=self.word_timestamps
+        )
+
+        # Segments are decoded lazily, so each one is yielded as soon as it is ready
+        for whisper_segment in segments:
+            segment = Segment.from_whisper(whisper_segment, self.chunk_start)
+            if segment.text:
+                yield segment
 
     def run(self):
         """Process and transcribe the audio chunk immediately."""
         try:
-            segments, _ = self.model.transcribe(
-                self.chunk,
-                language=self.language,
-                task=self.task,
-                beam_size=self.beam_size,
-                temperature=self.temperature,
-                suppress_blank=self.supress_blank
-            )
+            texts, sampled = [], False
+            for segment in self.transcribe():
+                texts.append(segment.text)
+                sampled = sampled or segment.temperature > 0
+                self.signal.emit(segment)
 
-            text = " ".join(segment.text.strip() for segment in segments if segment.text)
-            if text:
-                self.signal.emit(text)
+            if self.session is not None and self.chunk_index is not None:
+                self.session.annotate(self.chunk_index, texts, sampled)
 
         except Exception as e:
             print(f"Error in transcription: {e}")
 
 class AudioStreamer(QThread):
     """Threaded audio recording and transcription."""
-    new_text_signal = pyqtSignal(str)
+    new_segment_signal = pyqtSignal(object)  # Emits Segment
 
     def __init__(self, model_name: str = "medium", **settings):
         super().__init__()
-        self.model = get_whisper_model(model_name, settings.get("device"))  # Use cached model
+        self.model = get_whisper_model(  # Use cached model
+            model_name,
+            settings.get("device"),
+            settings.get("compute_type") or BASE_VARIANT
+        )
         self.thread_pool = QThreadPool.globalInstance()
         self.running = True  # Flag for stopping the thread
         self.settings = settings
+        self.stream_frames = 0  # Frames captured so far, for segment timestamps
+        self.session = SessionRecorder(
+            sample_rate=SAMPLE_RATE,
+            metadata=dict(settings, model_name=model_name)
+        ) if settings.get("record_session") else None
+        self.preprocessor = PreprocessingChain(SAMPLE_RATE) if settings.get("preprocessing") else None
 
     def run(self):
         """Continuously capture and process system audio."""
@@ -73,26 +119,90 @@ class AudioStreamer(QThread):
             with mic.recorder(samplerate=SAMPLE_RATE) as recorder:
                 while self.running:
                     data = recorder.record(numframes=int(SAMPLE_RATE * CHUNK_SEC))
+                    chunk_start = self.stream_frames / SAMPLE_RATE
+                    self.stream_frames += len(data)
 
                     if not self.running: # Double check
                         break
 
+                    # When recording, the mono chunk is written straight into the session file
+                    chunk_index, out = self.session.reserve(len(data)) if self.session else (None, None)
+
                     if data.ndim > 1:  # Convert stereo to mono
-                        data = np.mean(data, axis=1).astype(np.float32)
+                        data = np.mean(data, axis=1, out=out)
+                    elif out is not None:
+                        out[:] = data
+                        data = out
 
-                    chunk = data.astype(np.float32)
+                    chunk = data.astype(np.float32, copy=False)
 
                     # Process transcription immediately
-                    task = TranscriptionTask(self.model, chunk, self.new_text_signal, **self.settings)
-                    self.thread_pool.start(task)
+                    self.submit(chunk, chunk_start, chunk_index)
 
         except Exception as e:
             print(f"Error in audio streaming: {e}")
 
+    def make_task(self, chunk, chunk_start: float, chunk_index=None) -> TranscriptionTask:
+        """Preprocess a chunk and wrap it in a transcription task."""
+        if self.preprocessor is not None:
+            # Recordings keep the raw stream, so replays can be run with or without preprocessing
+            chunk = self.preprocessor.process(chunk)
+
+        return TranscriptionTask(
+            self.model, chunk, self.new_segment_signal,
+            session=self.session, chunk_index=chunk_index, chunk_start=chunk_start, **self.settings
+        )
+
+    def submit(self, chunk, chunk_start: float, chunk_index=None):
+        """Queue a chunk for transcription."""
+        self.thread_pool.start(self.make_task(chunk, chunk_start, chunk_index))
+
     def stop(self):
         """Stop the audio recording and ensure resources are released."""
         self.running = False  # Stop the loop
         self.thread_pool.clear()  # Cancel pending tasks
         self.quit()  # Request the thread to quit
         self.wait()  # Wait for the thread to finish safely
+
+        if self.session is not None:
+            # Chunks cleared from the queue or still running after this keep text None in the index
+            self.thread_pool.waitForDone(5000)
+            self.session.close()
+            self.session = None
+
+        if self.preprocessor is not None:
+            print(self.preprocessor.format_stats())
         print("Audio streaming stopped.")
+
+class ReplayStreamer(AudioStreamer):
+    """Feeds a recorded session back through the model, chunk for chunk and bit for bit."""
+
+    def __init__(self, session_path: str, model_name: str = "medium", realtime: bool = False, **settings):
+        settings.pop("record_session", None)  # Never re-record a replay
+        super().__init__(model_name, **settings)
+        self.session_path = session_path
+        self.realtime = realtime  # Pace chunks like live capture instead of as fast as possible
+
+    def run(self):
+        """Replay the recorded chunks in their original boundaries and order."""
+        try:
+            audio, index = load_session(self.session_path)
+            sample_rate = index.get("sample_rate", SAMPLE_RATE)
+
+            for chunk_info in index["chunks"]:
+                if not self.running:
+                    break
+
+                offset, frames = chunk_info["offset"], chunk_info["frames"]
+                started = time.perf_counter()
+
+                # Transcribed on this thread, one chunk at a time, so segments arrive in chunk order
+                self.make_task(audio[offset:offset + frames], offset / sample_rate).run()
+
+                if self.realtime:
+                    remaining = frames / sample_rate - (time.perf_counter() - started)
+                    if remaining > 0:
+                        self.msleep(int(remaining * 1000))
+
+        except Exception as e:
+            print(f"Error in session replay: {e}")
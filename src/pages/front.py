@@ -1,18 +1,11 @@
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
-    QWidget, QStackedWidget, QLabel, QComboBox, QHBoxLayout,
+    QApplication, QWidget, QStackedWidget, QLabel, QComboBox, QHBoxLayout,
     QPushButton, QVBoxLayout, QLineEdit, QSizePolicy, QFrame
 )
 
-from .listening import ListeningPage
-
-# Whisper Models
-WHISPER_MODELS = [
-    "tiny", "tiny.en", "base", "base.en", "small", "small.en",
-    "medium", "medium.en", "large-v1", "large-v2", "large-v3",
-    "distil-small.en", "distil-medium.en", "distil-large-v2", "distil-large-v3"
-]
+from src.audio.model_store import WHISPER_MODELS
 
 DEVICES = [
     "cpu",
@@ -185,6 +178,9 @@ class FrontPage(QWidget):
     def open_listening_page(self):
         """Start audio transcription and switch to listening page."""
         if self.listening_window is None:
+            # Imported here so the audio stack (NumPy, Faster Whisper, SoundCard) stays off the startup path
+            from .listening import ListeningPage
+
             whisper_settings_page = self.stacked_widget.widget(1)
             listening_settings_page = self.stacked_widget.widget(2)
             selected_model = self.combo_box.currentText()
@@ -201,6 +197,7 @@ class FrontPage(QWidget):
             )
 
             self.listening_window.stopped.connect(self.reset_listening_window)
+            QApplication.instance().aboutToQuit.connect(self.listening_window.stop_listening)
 
             self.listening_window.show()
             self.showMinimized()
@@ -1,32 +1,36 @@
 from typing import Dict, Union
 
 from PyQt6.QtCore import QTimer, Qt, QPoint, pyqtSignal
-from PyQt6.QtGui import QFont, QMouseEvent
+from PyQt6.QtGui import QCloseEvent, QFont, QMouseEvent
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout
 
-from src.audio import AudioStreamer
+from src.audio import AudioStreamer, ReplayStreamer, Segment
 
 
 class ListeningPage(QWidget):
     """Listening Page UI with dynamic text rendering and resizable behavior."""
 
     RESIZE_MARGIN = 10  # Margin for detecting resize edges
+    TEXT_TIMEOUT_MS = 8000  # How long a segment stays on screen once fully shown
     stopped = pyqtSignal()
 
     def __init__(
             self,
             selected_model: str,
-            listening_settings: Dict[str, Union[Dict[str, int], int, bool]],
+            listening_settings: Dict[str, Union[Dict[str, int], int, float, bool]],
             **whisper_settings
     ):
         super().__init__()
-        self.text_fragments = []
+        self.text_fragments = []  # One list of revealed words per segment
         self.audio_thread = None
         self.selected_model = selected_model
         self.whisper_settings = whisper_settings
         self.dragging = False
         self.resizing = False
         self.drag_position = QPoint()
+        self.reveal_words = False
+        self.min_avg_logprob = -1.0
+        self.max_no_speech_prob = 0.6
 
         # Label for transcribed text
         self.listening_label = QLabel("")
@@ -49,41 +53,82 @@ class ListeningPage(QWidget):
     def start_listening(self):
         """Start audio transcription thread."""
         if self.audio_thread is None or not self.audio_thread.isRunning():
-            self.audio_thread = AudioStreamer(self.selected_model, **self.whisper_settings)
-            self.audio_thread.new_text_signal.connect(self.add_text)
+            settings = dict(self.whisper_settings)
+            replay_session = settings.pop("replay_session", None)
+            replay_realtime = settings.pop("replay_realtime", False)
+
+            if replay_session:
+                self.audio_thread = ReplayStreamer(
+                    replay_session, self.selected_model, realtime=replay_realtime, **settings
+                )
+            else:
+                self.audio_thread = AudioStreamer(self.selected_model, **settings)
+            self.audio_thread.new_segment_signal.connect(self.add_segment)
             self.audio_thread.start()
 
-    def add_text(self, text):
-        """Dynamically add text and remove old parts after a delay."""
-        self.text_fragments.append(text)
-        self.update_label()
+    def should_show(self, segment: Segment) -> bool:
+        """Hide segments that are likely silence, using Whisper's own rule: both thresholds must be crossed."""
+        is_silence = segment.no_speech_prob > self.max_no_speech_prob and segment.avg_logprob < self.min_avg_logprob
+        return not is_silence
+
+    def add_segment(self, segment: Segment):
+        """Dynamically add a segment, word by word if enabled, and remove it after a delay."""
+        if not self.should_show(segment):
+            return
+
+        fragment = []
+        self.text_fragments.append(fragment)
+
+        if self.reveal_words and segment.words:
+            # Reveal each word with the same pacing it was spoken with
+            for word in segment.words:
+                delay = int((word.start - segment.start) * 1000)
+                QTimer.singleShot(max(delay, 0), lambda w=word.word: self.reveal_word(fragment, w))
+            shown_after = int((segment.end - segment.start) * 1000)
+        else:
+            fragment.append(segment.text)
+            self.update_label()
+            shown_after = 0
+
+        # Remove this part once it has been fully shown for a while
+        QTimer.singleShot(shown_after + self.TEXT_TIMEOUT_MS, lambda: self.remove_text(fragment))
 
-        # Remove this part after 8 seconds
-        QTimer.singleShot(8000, lambda: self.remove_text(text))
+    def reveal_word(self, fragment, word: str):
+        """Show the next word of a segment that is still on screen."""
+        if any(f is fragment for f in self.text_fragments):
+            fragment.append(word)
+            self.update_label()
 
-    def remove_text(self, text):
+    def remove_text(self, fragment):
         """Remove a specific text fragment after timeout."""
-        if text in self.text_fragments:
-            self.text_fragments.remove(text)
+        self.text_fragments = [f for f in self.text_fragments if f is not fragment]
         self.update_label()
 
     def update_label(self):
         """Update label text."""
-        self.listening_label.setText(" ".join(self.text_fragments))
+        self.listening_label.setText(" ".join("".join(f).strip() for f in self.text_fragments if f))
 
     def stop_listening(self):
-        """Stop transcription and clean up."""
+        """Stop transcription and close the window."""
+        self.close()  # Cleanup happens in closeEvent
+
+    def closeEvent(self, event: QCloseEvent):
+        """Stop transcription however the window is closed, so recordings are finalized."""
         if self.audio_thread:
             self.audio_thread.stop()
             self.audio_thread = None
 
-        self.text_fragments.clear()
-        self.update_label()
-        self.stopped.emit()
-        self.close()
+            self.text_fragments.clear()
+            self.update_label()
+            self.stopped.emit()
+        super().closeEvent(event)
+
+    def apply_settings(self, settings: Dict[str, Union[Dict[str, int], int, float, bool]]):
+        """Apply UI settings such as colors, window behavior and segment filtering."""
+        self.reveal_words = settings.get("reveal_words", False)
+        self.min_avg_logprob = settings.get("min_avg_logprob", -1.0)
+        self.max_no_speech_prob = settings.get("max_no_speech_prob", 0.6)
 
-    def apply_settings(self, settings: Dict[str, Union[Dict[str, int], int, bool]]):
-        """Apply UI settings such as colors and window behavior."""
         if settings["frameless"]:
             self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
         else:
@@ -71,6 +71,36 @@ class ListeningSettings(QWidget):
         bg_group.setLayout(bg_layout)
         main_layout.addWidget(bg_group)
 
+        # Segment Display Group
+        segment_group = QGroupBox("Segment Display")
+        segment_layout = QVBoxLayout()
+
+        self.reveal_words_checkbox = QCheckBox("Reveal Words In Sync (needs Word Timestamps)")
+        self.reveal_words_checkbox.setChecked(False)
+
+        self.min_confidence_label = QLabel()
+        self.min_confidence_slider = QSlider(Qt.Orientation.Horizontal)
+        self.min_confidence_slider.setMinimum(-300)  # Average log probability, in hundredths
+        self.min_confidence_slider.setMaximum(0)
+        self.min_confidence_slider.setValue(-100)
+        self.min_confidence_slider.valueChanged.connect(self.update_filter_labels)
+
+        self.max_no_speech_label = QLabel()
+        self.max_no_speech_slider = QSlider(Qt.Orientation.Horizontal)
+        self.max_no_speech_slider.setMinimum(0)  # No-speech probability, in percent
+        self.max_no_speech_slider.setMaximum(100)
+        self.max_no_speech_slider.setValue(60)
+        self.max_no_speech_slider.valueChanged.connect(self.update_filter_labels)
+
+        segment_layout.addWidget(self.reveal_words_checkbox)
+        segment_layout.addWidget(self.min_confidence_label)
+        segment_layout.addWidget(self.min_confidence_slider)
+        segment_layout.addWidget(self.max_no_speech_label)
+        segment_layout.addWidget(self.max_no_speech_slider)
+        segment_group.setLayout(segment_layout)
+        main_layout.addWidget(segment_group)
+        self.update_filter_labels()
+
         # Frameless Checkbox
         self.frameless_checkbox = QCheckBox("Enable Frameless Window")
         self.frameless_checkbox.setChecked(True)
@@ -116,6 +146,13 @@ class ListeningSettings(QWidget):
         self.font_size = value
         self.update_preview()
 
+    def update_filter_labels(self):
+        # Like Whisper, a segment is only hidden when it crosses both thresholds
+        self.min_confidence_label.setText(
+            f"Hide Segments Below Avg Log Probability: {self.min_confidence_slider.value() / 100:.2f}")
+        self.max_no_speech_label.setText(
+            f"...And Above No-Speech Probability: {self.max_no_speech_slider.value() / 100:.2f}")
+
     def update_preview(self):
         text_rgba = f"rgba({self.text_color.red()}, {self.text_color.green()}, {self.text_color.blue()}, {self.text_color.alpha() / 255})"
         bg_rgba = f"rgba({self.bg_color.red()}, {self.bg_color.green()}, {self.bg_color.blue()}, {self.bg_color.alpha() / 255})"
@@ -129,7 +166,7 @@ class ListeningSettings(QWidget):
             font-size: {self.font_size}px;
         """)
 
-    def get_settings(self) -> Dict[str, Union[Dict[str, int], int, bool]]:
+    def get_settings(self) -> Dict[str, Union[Dict[str, int], int, float, bool]]:
         return {
             "text_color": {
                 "r": self.text_color.red(),
@@ -146,5 +183,8 @@ class ListeningSettings(QWidget):
             "text_alpha": self.text_alpha_slider.value(),
             "bg_alpha": self.bg_alpha_slider.value(),
             "font_size": self.font_size,
-            "frameless": self.frameless_checkbox.isChecked()
+            "frameless": self.frameless_checkbox.isChecked(),
+            "reveal_words": self.reveal_words_checkbox.isChecked(),
+            "min_avg_logprob": self.min_confidence_slider.value() / 100,
+            "max_no_speech_prob": self.max_no_speech_slider.value() / 100
         }
@@ -3,6 +3,13 @@ from PyQt6.QtWidgets import (
     QVBoxLayout, QGridLayout, QLabel, QGroupBox, QStackedWidget, QPushButton, QSizePolicy
 )
 
+COMPUTE_TYPES = [
+    "float16",
+    "int8",
+    "int8_float32",
+    "float32"
+]
+
 class WhisperSettings(QWidget):
 
     def __init__(self, stacked_widget: QStackedWidget):
@@ -31,11 +38,43 @@ class WhisperSettings(QWidget):
         self.temperature.setToolTip(
             "A comma-separated list of temperature values for sampling diversity. Lower values make output more deterministic.")
 
+        self.compute_type = QComboBox()
+        self.compute_type.addItems(COMPUTE_TYPES)
+        self.compute_type.setToolTip(
+            "Precision used to run the model. int8 variants are faster and lighter; "
+            "pre-quantized copies from the local model store load without requantizing.")
+
         self.suppress_blank = QCheckBox("Suppress Blank")
         self.suppress_blank.setChecked(True)
         self.suppress_blank.setToolTip(
             "If enabled, removes unnecessary silent pauses at the beginning of transcriptions.")
 
+        self.preprocessing = QCheckBox("Audio Preprocessing")
+        self.preprocessing.setChecked(False)
+        self.preprocessing.setToolTip(
+            "If enabled, removes DC offset and low rumble, gates background noise and evens out loudness "
+            "before transcription. Reduces hallucinations on quiet or noisy audio.")
+
+        self.word_timestamps = QCheckBox("Word Timestamps")
+        self.word_timestamps.setChecked(False)
+        self.word_timestamps.setToolTip(
+            "If enabled, times every word so subtitles can be revealed in sync with the audio. Adds some decoding time.")
+
+        self.record_session = QCheckBox("Record Session")
+        self.record_session.setChecked(False)
+        self.record_session.setToolTip(
+            "If enabled, saves the captured audio and emitted text to the 'sessions' folder so it can be replayed later.")
+
+        self.replay_session = QLineEdit()
+        self.replay_session.setPlaceholderText("Path to a recorded session (optional)")
+        self.replay_session.setToolTip(
+            "If set, listening replays this recorded session through the model instead of capturing live audio.")
+
+        self.replay_realtime = QCheckBox("Replay In Real Time")
+        self.replay_realtime.setChecked(True)
+        self.replay_realtime.setToolTip(
+            "If enabled, a replayed session is paced like live audio; otherwise it is transcribed as fast as possible.")
+
         self.reset_button = QPushButton("Reset to Default")
         self.reset_button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.reset_button.clicked.connect(self.reset_defaults)
@@ -54,10 +93,20 @@ class WhisperSettings(QWidget):
         form_layout.addWidget(QLabel("Temperature:"), 3, 0)
         form_layout.addWidget(self.temperature, 3, 1)
 
+        form_layout.addWidget(QLabel("Compute Type:"), 4, 0)
+        form_layout.addWidget(self.compute_type, 4, 1)
+
+        form_layout.addWidget(QLabel("Replay Session:"), 5, 0)
+        form_layout.addWidget(self.replay_session, 5, 1)
+
         # Checkbox layout
         checkbox_group = QGroupBox("Additional Options")
         checkbox_layout = QVBoxLayout()
         checkbox_layout.addWidget(self.suppress_blank)
+        checkbox_layout.addWidget(self.preprocessing)
+        checkbox_layout.addWidget(self.word_timestamps)
+        checkbox_layout.addWidget(self.record_session)
+        checkbox_layout.addWidget(self.replay_realtime)
         checkbox_group.setLayout(checkbox_layout)
 
         # Add layouts to main layout
@@ -73,7 +122,13 @@ class WhisperSettings(QWidget):
         self.task.setCurrentIndex(0)
         self.beam_size.setValue(5)
         self.temperature.setText("0.0, 0.2, 0.4, 0.6, 0.8, 1.0")
+        self.compute_type.setCurrentIndex(0)
         self.suppress_blank.setChecked(True)
+        self.preprocessing.setChecked(False)
+        self.word_timestamps.setChecked(False)
+        self.record_session.setChecked(False)
+        self.replay_session.clear()
+        self.replay_realtime.setChecked(True)
 
     def go_back(self):
         """Switch back to the main page."""
@@ -85,5 +140,11 @@ class WhisperSettings(QWidget):
             "task": self.task.currentText(),
             "beam_size": self.beam_size.value(),
             "temperature": self.temperature.text(),
+            "compute_type": self.compute_type.currentText(),
             "suppress_blank": self.suppress_blank.isChecked(),
+            "preprocessing": self.preprocessing.isChecked(),
+            "word_timestamps": self.word_timestamps.isChecked(),
+            "record_session": self.record_session.isChecked(),
+            "replay_session": self.replay_session.text().strip() or None,
+            "replay_realtime": self.replay_realtime.isChecked(),
         }
@@ -0,0 +1,129 @@
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Imported first thing in main, so in-process marks leave out interpreter startup and the src import;
+# the cold start check measures those with wall-clock time from outside instead
+PROCESS_START = time.perf_counter()
+
+REPORT_ENV = "LIVE_SUBTITLES_STARTUP_REPORT"  # "1" prints a report, "exit" prints JSON and quits after first paint
+STARTUP_BUDGET_SEC = 1.5  # Cold start budget, from process launch to first paint
+
+# Only needed once listening starts; must not be imported before the first paint
+HEAVY_MODULES = ["numpy", "scipy", "soundcard", "ctranslate2", "faster_whisper", "src.audio.transcription"]
+
+# Imported in the background after the first paint. soundcard is left out on purpose:
+# on Windows it sets up COM for the importing thread, so it is imported on the main thread.
+WARM_UP_MODULES = ["numpy", "scipy.signal", "ctranslate2", "faster_whisper"]
+
+marks = {}  # Startup milestones, in seconds since PROCESS_START
+import_times = {}  # Import durations, in seconds
+
+
+def elapsed() -> float:
+    """Seconds since startup began."""
+    return time.perf_counter() - PROCESS_START
+
+
+def mark(name: str):
+    """Record a startup milestone; only the first occurrence counts."""
+    marks.setdefault(name, elapsed())
+
+
+@contextmanager
+def timed_import(name: str):
+    """Time the imports inside the block."""
+    start = time.perf_counter()
+    yield
+    import_times[name] = time.perf_counter() - start
+
+
+def loaded_heavy_modules():
+    """Return the heavy modules that are already imported."""
+    return [name for name in HEAVY_MODULES if name in sys.modules]
+
+
+def report() -> dict:
+    """Return the startup timings as a dictionary."""
+    return {
+        "marks": dict(marks),
+        "imports": dict(import_times),
+        "heavy_modules_loaded": loaded_heavy_modules(),
+        "wall_time": time.time(),  # Lets a parent process measure from when it launched the app
+    }
+
+
+def format_report() -> str:
+    """Return the startup timings as readable text."""
+    lines = ["Startup report:"]
+    lines += [f"  {name:<28}{seconds * 1000:8.1f} ms" for name, seconds in marks.items()]
+    lines.append("Import breakdown:")
+    lines += [f"  {name:<28}{seconds * 1000:8.1f} ms" for name, seconds in import_times.items()]
+    return "\n".join(lines)
+
+
+def warm_up(on_done=None):
+    """Import the heavy dependencies in a background thread."""
+    def run():
+        for name in WARM_UP_MODULES:
+            try:
+                with timed_import(f"warm-up {name}"):
+                    importlib.import_module(name)
+            except Exception as e:
+                print(f"Error warming up {name}: {e}")
+        mark("warm_up_done")
+        if on_done is not None:
+            on_done()
+
+    threading.Thread(target=run, name="warm-up", daemon=True).start()
+
+
+def check_cold_start(budget: float = STARTUP_BUDGET_SEC) -> int:
+    """Launch the app headless in a fresh interpreter and check time to first paint against the budget.
+
+    The budget covers the true cold start: from launching the process, including interpreter
+    startup, until the window first paints.
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    env[REPORT_ENV] = "exit"
+    launched = time.time()
+    result = subprocess.run(
+        [sys.executable, "-m", "src.main"],
+        env=env, capture_output=True, text=True, timeout=60
+    )
+
+    try:
+        data = json.loads(result.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        print(f"Error in startup check: no report from the app\n{result.stderr}")
+        return 1
+
+    cold_start = data["wall_time"] - launched
+    print(f"Cold start to first paint: {cold_start * 1000:.1f} ms (budget {budget * 1000:.0f} ms)")
+    print(f"  {'before src.startup':<28}{(cold_start - data['marks']['first_paint']) * 1000:8.1f} ms")
+    for name, seconds in data["marks"].items():
+        print(f"  {name:<28}{seconds * 1000:8.1f} ms")
+    print("Import breakdown:")
+    for name, seconds in data["imports"].items():
+        print(f"  {name:<28}{seconds * 1000:8.1f} ms")
+
+    failed = False
+    if cold_start > budget:
+        print("FAIL: cold start is over budget")
+        failed = True
+    if data["heavy_modules_loaded"]:
+        print(f"FAIL: imported before first paint: {', '.join(data['heavy_modules_loaded'])}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the desktop app's cold start time.")
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_SEC, help="Budget in seconds")
+    sys.exit(check_cold_start(parser.parse_args().budget))